@@ -11,8 +11,12 @@ setup(
     install_requires=[
         'requests',
         'prettytable',
-        'pyparsing',
     ],
+    extras_require={
+        'fast': ['orjson'],
+        'stream': ['ijson'],
+        'test': ['pytest'],
+    },
     entry_points={
         'console_scripts': [
             'sto-cargo-search=sto_cargo_search.cli:main',
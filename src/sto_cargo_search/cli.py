@@ -5,24 +5,49 @@ Supports logical search expressions and formats data into tables or detailed vie
 
 import json
 import argparse
+import hashlib
+import itertools
 import re
 import html
 import time
 import requests
 import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
+from email.utils import formatdate
 from prettytable import PrettyTable
-from pyparsing import infixNotation, opAssoc, Word, QuotedString, alphanums, ParserElement, ParseException
-from html.parser import HTMLParser
 
-ParserElement.enablePackrat()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+else:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+_JSON_ERRORS = (json.JSONDecodeError, ijson.JSONError) if ijson is not None else (json.JSONDecodeError,)
 
 # === Constants for Cargo Downloading ===
 WIKI_BASE_URL = "https://stowiki.net/wiki/"
 CARGO_EXPORT_PAGE = "Special:CargoExport"
 DEFAULT_CACHE_DIR = Path(os.path.expanduser('~')) / '.sto-cargo-cache'
 CACHE_EXPIRE_DAYS = 3
+PAGE_DELAY_SECONDS = 0.2
 
 CARGO_TYPES = {
     'equipment': {
@@ -48,6 +73,12 @@ CARGO_TYPES = {
     },
 }
 
+# Protocol 4 is readable by every supported Python, so a cache dir can be shared between versions.
+PICKLE_PROTOCOL = 4
+# Bump when _build_haystack or identify changes so older processed rows are rebuilt.
+PROCESSED_FORMAT_VERSION = 1
+_PICKLE_ERRORS = (OSError, EOFError, ValueError, TypeError, pickle.UnpicklingError)
+
 class CargoDownloader:
     def __init__(self, force_download=False, cache_dir=DEFAULT_CACHE_DIR):
         self.force_download = force_download
@@ -72,146 +103,285 @@ class CargoDownloader:
     def cache_file(self, cargo_type):
         return self.cache_dir / f"{cargo_type}.json"
 
+    def digest_file(self, cargo_type):
+        return self.cache_dir / f"{cargo_type}.sha256"
+
     def is_cache_valid(self, path):
         if not path.exists():
             return False
         return datetime.fromtimestamp(path.stat().st_mtime) > datetime.now() - timedelta(days=CACHE_EXPIRE_DAYS)
 
     def download_all(self):
-        for cargo_type in CARGO_TYPES:
-            self.download(cargo_type)
+        with ThreadPoolExecutor(max_workers=len(CARGO_TYPES)) as executor:
+            futures = [executor.submit(self.download, cargo_type) for cargo_type in CARGO_TYPES]
+            for future in futures:
+                future.result()
 
     def download(self, cargo_type):
         path = self.cache_file(cargo_type)
         if not self.force_download and self.is_cache_valid(path):
             return
 
+        # Revalidate an expired cache instead of refetching it unconditionally.
+        headers = {}
+        if not self.force_download and path.exists():
+            headers['If-Modified-Since'] = formatdate(path.stat().st_mtime, usegmt=True)
+
         print(f"Downloading {cargo_type} data...")
         all_data = []
         offset = 0
-        while True:
-            url = self.build_url(cargo_type, offset)
-            response = requests.get(url)
-            if not response.ok:
-                print(f"Failed to download {cargo_type} at offset {offset}")
-                break
-
-            batch = response.json()
-            if not batch:
-                break
-
-            all_data.extend(batch)
-
-            if len(batch) < CARGO_TYPES[cargo_type]['limit']:
-                break
-
-            offset += CARGO_TYPES[cargo_type]['limit']
-            time.sleep(1)  # Be polite to the server
+        with requests.Session() as session:
+            while True:
+                url = self.build_url(cargo_type, offset)
+                response = session.get(url, headers=headers)
+                if response.status_code == 304:
+                    print(f"{cargo_type} data is unchanged.")
+                    self.refresh(cargo_type)
+                    return
+                headers = {}
+                if not response.ok:
+                    print(f"Failed to download {cargo_type} at offset {offset}")
+                    if offset == 0:
+                        return
+                    break
+
+                batch = _loads(response.content)
+                if not batch:
+                    break
+
+                all_data.extend(batch)
+
+                if len(batch) < CARGO_TYPES[cargo_type]['limit']:
+                    break
+
+                offset += CARGO_TYPES[cargo_type]['limit']
+                time.sleep(PAGE_DELAY_SECONDS)  # Be polite to the server
+
+        content = _dumps(all_data)
+        digest = hashlib.sha256(content).hexdigest()
+        digest_path = self.digest_file(cargo_type)
+        if path.exists() and digest_path.exists() and digest_path.read_text() == digest:
+            self.refresh(cargo_type)
+            return
 
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(all_data, f, ensure_ascii=False, indent=2)
+        with open(path, 'wb') as f:
+            f.write(content)
+        digest_path.write_text(digest)
+        self.save_processed(cargo_type, all_data)
+
+    def refresh(self, cargo_type):
+        """Marks an unchanged cache as fresh again, keeping derived files that were current and removing stale ones."""
+        derived = [self.processed_file(cargo_type)]
+        current = [path for path in derived if self.is_derived_valid(path, cargo_type)]
+        os.utime(self.cache_file(cargo_type), None)
+        for path in derived:
+            if path in current:
+                os.utime(path, None)
+            elif path.exists():
+                path.unlink()
+
+    def is_derived_valid(self, path, cargo_type):
+        """Checks that a file derived from the JSON cache was written after it."""
+        return path.exists() and path.stat().st_mtime >= self.cache_file(cargo_type).stat().st_mtime
 
     def load(self, cargo_type):
         path = self.cache_file(cargo_type)
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-
-class HTMLStripper(HTMLParser):
-    """Utility class to strip HTML tags from text."""
-    def __init__(self):
-        super().__init__()
-        self.result = []
-
-    def handle_data(self, d):
-        self.result.append(d)
+        with open(path, 'rb') as f:
+            return _loads(f.read())
+
+    def processed_file(self, cargo_type):
+        return self.cache_dir / f"{cargo_type}.pkl"
+
+    def save_processed(self, cargo_type, data):
+        rows = [(identify(obj), _build_haystack(obj), obj) for obj in data] if isinstance(data, list) else []
+        with open(self.processed_file(cargo_type), 'wb') as f:
+            pickle.dump((PROCESSED_FORMAT_VERSION, rows), f, protocol=PICKLE_PROTOCOL)
+        return rows
+
+    def load_processed(self, cargo_type):
+        """Returns (identifier, haystack, object) rows, preferring the pickle if it is current; the cache dir must be trusted."""
+        path = self.processed_file(cargo_type)
+        if self.is_derived_valid(path, cargo_type):
+            try:
+                with open(path, 'rb') as f:
+                    version, rows = pickle.load(f)
+                if version == PROCESSED_FORMAT_VERSION:
+                    return rows
+            except _PICKLE_ERRORS:
+                pass
+        return self.save_processed(cargo_type, self.load(cargo_type))
 
-    def get_data(self):
-        return ''.join(self.result)
+_BR_RE = re.compile(r'<br\s*/?>', re.IGNORECASE)
+_TAG_RE = re.compile(r'<[a-zA-Z/!?][^>]*>')
 
 def strip_html_tags(text):
     """Removes HTML tags and unescapes HTML entities from a string."""
-    text = html.unescape(text)
-    text = re.sub(r'<br\s*/?>', '\n', text, flags=re.IGNORECASE)
-    stripper = HTMLStripper()
-    stripper.feed(text)
-    return stripper.get_data()
+    if '&' in text:
+        text = html.unescape(text)
+    if '<' not in text:
+        return text
+    return _TAG_RE.sub('', _BR_RE.sub('\n', text))
+
+def _build_haystack(obj):
+    """Joins the lowercased values of an object into one string; \x01 keeps terms within a field."""
+    return '\x01'.join(
+        (value if type(value) is str else str(value)).lower() for value in obj.values() if value is not None
+    )
 
 class SearchTerm:
     """Represents a single keyword term in a search expression."""
-    def __init__(self, tokens):
-        self.term = tokens[0]
+    def __init__(self, term):
+        self.term = term
+        self._term_lc = self.term.lower()
 
-    def evaluate(self, obj):
-        for key, value in obj.items():
-            if value is not None and self.term.lower() in str(value).lower():
-                return True
-        return False
+    def evaluate(self, haystack):
+        return self._term_lc in haystack
 
 class BinaryOperation:
     """Handles AND and OR operations in the search expression."""
-    def __init__(self, tokens):
-        self.operator = tokens[0][1].lower()
-        self.operands = tokens[0][0::2]
+    def __init__(self, operator, operands):
+        self.operator = operator
+        # Single terms are cheaper than nested expressions, so try them first when short-circuiting.
+        self.operands = sorted(operands, key=lambda op: not isinstance(op, SearchTerm))
 
-    def evaluate(self, obj):
+    def evaluate(self, haystack):
         if self.operator == 'and':
-            return all(op.evaluate(obj) for op in self.operands)
+            for op in self.operands:
+                if not op.evaluate(haystack):
+                    return False
+            return True
         elif self.operator == 'or':
-            return any(op.evaluate(obj) for op in self.operands)
+            for op in self.operands:
+                if op.evaluate(haystack):
+                    return True
+            return False
 
 class NotOperation:
     """Handles NOT operation in the search expression."""
-    def __init__(self, tokens):
-        self.operand = tokens[0][1]
+    def __init__(self, operand):
+        self.operand = operand
 
-    def evaluate(self, obj):
-        return not self.operand.evaluate(obj)
+    def evaluate(self, haystack):
+        return not self.operand.evaluate(haystack)
 
 def load_json_file(filepath):
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    with open(filepath, 'rb') as f:
+        return _loads(f.read())
+
+def iter_json_file(filepath):
+    """Yields the objects of a JSON list file, streaming them with ijson when it is installed."""
+    if ijson is None:
+        data = load_json_file(filepath)
+        if isinstance(data, list):
+            yield from data
+        return
+    with open(filepath, 'rb') as f:
+        yield from ijson.items(f, 'item', use_float=True)
+
+class SearchExpressionError(ValueError):
+    """Raised when a search expression cannot be parsed."""
+
+_TOKEN_RE = re.compile(r'"([^"]*)"|([()])|([A-Za-z0-9_\-]+|,)|(\S)')
+_OPERATORS = {'and': 'and', 'or': 'or', 'not': 'not', ',': 'or'}
+_BINARY_PRECEDENCE = {'or': 1, 'and': 2}
+
+def _tokenize(expr):
+    """Splits a search expression into (kind, value, offset) tuples; commas are treated as OR."""
+    tokens = []
+    for match in _TOKEN_RE.finditer(expr):
+        quoted, punct, word, other = match.groups()
+        if quoted is not None:
+            tokens.append(('term', quoted, match.start()))
+        elif punct:
+            tokens.append((punct, punct, match.start()))
+        elif word:
+            tokens.append((_OPERATORS.get(word.lower(), 'term'), word, match.start()))
+        else:
+            raise SearchExpressionError(f"Unexpected character {other!r} (at char {match.start()})")
+    tokens.append(('end', None, len(expr)))
+    return tokens
+
+def _unexpected(token):
+    kind, value, offset = token
+    found = 'end of expression' if kind == 'end' else repr(value)
+    return SearchExpressionError(f"Expected a search term, found {found} (at char {offset})")
+
+def _parse_operand(tokens, pos):
+    kind = tokens[pos][0]
+    if kind == 'term':
+        return SearchTerm(tokens[pos][1]), pos + 1
+    if kind == 'not':
+        operand, pos = _parse_operand(tokens, pos + 1)
+        return NotOperation(operand), pos
+    if kind == '(':
+        node, pos = _parse_binary(tokens, pos + 1)
+        if tokens[pos][0] != ')':
+            raise SearchExpressionError(f"Unbalanced parentheses (at char {tokens[pos][2]})")
+        return node, pos + 1
+    raise _unexpected(tokens[pos])
+
+def _parse_binary(tokens, pos, min_precedence=1):
+    node, pos = _parse_operand(tokens, pos)
+    while True:
+        operator = tokens[pos][0]
+        precedence = _BINARY_PRECEDENCE.get(operator)
+        if precedence is None or precedence < min_precedence:
+            return node, pos
+        operands = [node]
+        while tokens[pos][0] == operator:
+            operand, pos = _parse_binary(tokens, pos + 1, precedence + 1)
+            operands.append(operand)
+        node = BinaryOperation(operator, operands)
 
 def parse_search_expression(expr):
-    expr = expr.replace(',', ' OR')
-    expr = re.sub(r'\bAND\b', 'and', expr, flags=re.IGNORECASE)
-    expr = re.sub(r'\bOR\b', 'or', expr, flags=re.IGNORECASE)
-    expr = re.sub(r'\bNOT\b', 'not', expr, flags=re.IGNORECASE)
-    term = QuotedString('"') | Word(alphanums + '-_')
-    term.setParseAction(SearchTerm)
-    search_expr = infixNotation(term,
-        [
-            ('not', 1, opAssoc.RIGHT, NotOperation),
-            ('and', 2, opAssoc.LEFT, BinaryOperation),
-            ('or',  2, opAssoc.LEFT, BinaryOperation),
-        ])
     try:
-        return search_expr.parseString(expr, parseAll=True)[0]
-    except ParseException as e:
+        tokens = _tokenize(expr)
+        tree, pos = _parse_binary(tokens, 0)
+        if tokens[pos][0] != 'end':
+            raise SearchExpressionError(f"Unexpected {tokens[pos][1]!r} (at char {tokens[pos][2]})")
+        return tree
+    except SearchExpressionError as e:
         print(f"Error parsing search expression: {e}")
         exit(1)
 
 def format_text_with_indent(text, indent_level, strip_html=True):
     if strip_html:
         text = strip_html_tags(text)
-    lines = text.split('\n')
-    formatted_lines = []
-    for line in lines:
-        if ':' in line:
-            parts = line.split(':', 1)
-            formatted_lines.append('\t' * indent_level + parts[0].strip())
-            formatted_lines[-1] += '\t' + parts[1].strip()
-        else:
-            formatted_lines.append('\t' * indent_level + line.strip())
-    return '\n'.join(formatted_lines)
+    indent = '\t' * indent_level
+    return '\n'.join([
+        f"{indent}{label.strip()}\t{value.strip()}" if sep else indent + label.strip()
+        for label, sep, value in (line.partition(':') for line in text.split('\n'))
+    ])
+
+def identify(obj):
+    return obj.get('name') or obj.get('doff_specialization') or obj.get('_pageName')
+
+def dedupe_matches(objs, identifiers=None):
+    """Keeps the first entry for each identifier; DOff specializations are never deduplicated."""
+    if identifiers is None:
+        identifiers = [identify(obj) for obj in objs]
+    first_positions = {}
+    for position, identifier in enumerate(identifiers):
+        if identifier:
+            first_positions.setdefault(identifier, position)
+    return [
+        obj for position, (obj, identifier) in enumerate(zip(objs, identifiers))
+        if identifier and (obj.get('doff_specialization') or first_positions[identifier] == position)
+    ]
+
+_STARSHIP_TRAIT_KEYS = frozenset(('basic', 'detailed', 'obtained'))
+_PERSONAL_TRAIT_KEYS = frozenset(('chartype', 'environment'))
+_EQUIPMENT_KEY_PREFIXES = ('head', 'subhead', 'text')
 
 def detect_format(obj):
+    keys = obj.keys()
     if 'doff_specialization' in obj:
         return 'doff'
-    elif 'basic' in obj or 'detailed' in obj or 'obtained' in obj:
+    elif not _STARSHIP_TRAIT_KEYS.isdisjoint(keys):
         return 'starship_trait'
-    elif 'chartype' in obj and 'environment' in obj:
+    elif _PERSONAL_TRAIT_KEYS.issubset(keys):
         return 'personal_trait'
-    elif any(k.startswith('head') or k.startswith('text') or k.startswith('subhead') for k in obj.keys()):
+    elif any(k.startswith(_EQUIPMENT_KEY_PREFIXES) for k in keys):
         return 'equipment'
     return 'unknown'
 
@@ -220,15 +390,15 @@ def print_equipment(obj, strip_html):
         if key in obj:
             print(f"{key.capitalize()}: {obj[key]}")
     print()
-    pattern = re.compile(r'^(head|subhead|text)(\d+)$', re.IGNORECASE)
     fields = {}
     for key, value in obj.items():
-        if value is not None:
-            match = pattern.match(key)
-            if match:
-                group, number = match.groups()
-                number = int(number)
-                fields.setdefault(number, {})[group.lower()] = value
+        if value is None:
+            continue
+        key = key.lower()
+        for prefix in _EQUIPMENT_KEY_PREFIXES:
+            if key.startswith(prefix) and key[len(prefix):].isdecimal():
+                fields.setdefault(int(key[len(prefix):]), {})[prefix] = value
+                break
     for num in sorted(fields):
         section = fields[num]
         head = section.get('head')
@@ -288,6 +458,43 @@ def print_personal_trait(obj, strip_html):
         print(format_text_with_indent(obj['description'], 1, strip_html))
     print("\n" + "-"*40 + "\n")
 
+# Result sections are printed in this order.
+_PRINTERS = {
+    'equipment': print_equipment,
+    'starship_trait': print_starship_trait,
+    'doff': print_doff,
+    'personal_trait': print_personal_trait,
+}
+
+_TABLE_LAYOUTS = {
+    'equipment': (
+        ["Type", "Name", "Rarity"],
+        lambda obj: [obj.get('type', ''), obj.get('name', ''), obj.get('rarity', '')],
+    ),
+    'starship_trait': (
+        ["Type", "Name", "Short"],
+        lambda obj: [obj.get('type', ''), obj.get('name', ''), obj.get('short', '')],
+    ),
+    'doff': (
+        ["DOff Specialization", "Ship Duty", "Department", "Description"],
+        lambda obj: [
+            obj.get('doff_specialization', ''),
+            obj.get('shipdutytype', ''),
+            obj.get('department', ''),
+            strip_html_tags(obj.get('description', '') or ''),
+        ],
+    ),
+    'personal_trait': (
+        ["Name", "Type", "Environment", "Unique"],
+        lambda obj: [
+            obj.get('name', ''),
+            obj.get('type', ''),
+            obj.get('environment', ''),
+            'Yes' if obj.get('isunique') else 'No',
+        ],
+    ),
+}
+
 def main():
     parser = argparse.ArgumentParser(description='Search STO cargo files and display content.', formatter_class=argparse.RawTextHelpFormatter)
     parser.add_argument('--file', help='Path to a specific JSON file')
@@ -332,113 +539,77 @@ If not specified, all types will be searched."""
         'personal_trait': downloader.cache_file('personal_trait')
     }
 
-    selected_types = args.search_type if args.search_type else list(CARGO_TYPES.keys())
-    selected_types = set(selected_types) & set(CARGO_TYPES.keys())
+    requested_types = set(args.search_type) if args.search_type else set(CARGO_TYPES)
+    selected_types = [stype for stype in _PRINTERS if stype in requested_types]
 
     if not selected_types:
         print("Error: No valid search types selected.")
         parser.print_help()
         exit(1)
         
-    all_matches = {'equipment': [], 'starship_trait': [], 'doff': [], 'personal_trait': []}
+    all_matches = {}
+    search_tree = parse_search_expression(args.search) if args.search else None
 
     if args.file:
         if not Path(args.file).exists():
             print(f"File not found: {args.file}")
             return
+        stream = iter_json_file(args.file)
         try:
-            data = load_json_file(args.file)
-        except json.JSONDecodeError as e:
+            first = next(stream, None)
+            if first is None:
+                print("JSON data must be a list of objects.")
+                return
+            inferred_type = detect_format(first)
+            if inferred_type not in _PRINTERS:
+                print("Error: Could not determine the format of the JSON data.")
+                return
+            if args.search_type and args.search_type != inferred_type:
+                print(f"Error: File format is '{inferred_type}', but --search-type was set to '{args.search_type}'.")
+                return
+            data = itertools.chain([first], stream)
+            if search_tree:
+                data = (obj for obj in data if search_tree.evaluate(_build_haystack(obj)))
+            matches = dedupe_matches(list(data))
+            if matches:
+                all_matches[inferred_type] = matches
+        except _JSON_ERRORS as e:
             print(f"Error loading JSON: {e}")
             return
-        if not isinstance(data, list):
-            print("JSON data must be a list of objects.")
-            return
-        inferred_type = detect_format(data[0])
-        if args.search_type and args.search_type != inferred_type:
-            print(f"Error: File format is '{inferred_type}', but --search-type was set to '{args.search_type}'.")
-            return
-        search_tree = parse_search_expression(args.search) if args.search else None
-        seen = set()
-        for obj in data:
-            identifier = obj.get('name') or obj.get('doff_specialization') or obj.get('_pageName')
-            if identifier and (obj.get('doff_specialization') or identifier not in seen):
-                if not search_tree or search_tree.evaluate(obj):
-                    all_matches[inferred_type].append(obj)
-                    seen.add(identifier)
     else:
         for stype in selected_types:
             filename = default_files.get(stype)
             if not filename or not Path(filename).exists():
                 continue
             try:
-                data = load_json_file(filename)
+                rows = downloader.load_processed(stype)
             except json.JSONDecodeError:
                 continue
-            if not isinstance(data, list):
-                continue
-            search_tree = parse_search_expression(args.search) if args.search else None
-            seen = set()
-            for obj in data:
-                identifier = obj.get('name') or obj.get('doff_specialization') or obj.get('_pageName')
-                if identifier and (obj.get('doff_specialization') or identifier not in seen):
-                    if not search_tree or search_tree.evaluate(obj):
-                        all_matches[stype].append(obj)
-                        seen.add(identifier)
+            if search_tree:
+                rows = [row for row in rows if search_tree.evaluate(row[1])]
+            matches = dedupe_matches([obj for _, _, obj in rows], [identifier for identifier, _, _ in rows])
+            if matches:
+                all_matches[stype] = matches
 
     strip_html = not args.no_strip_html
 
     printed_header = False
-    if args.full:
-        for fmt, items in all_matches.items():
-            if items:
-                if printed_header:
-                    print()
-                    
-                print(f"=== {fmt.replace('_', ' ').upper()} MATCHES ===\n")
-                printed_header = True
-
-                for obj in items:
-                    if fmt == 'starship_trait':
-                        print_starship_trait(obj, strip_html)
-                    elif fmt == 'doff':
-                        print_doff(obj, strip_html)
-                    elif fmt == 'equipment':
-                        print_equipment(obj, strip_html)
-                    elif fmt == 'personal_trait':
-                        print_personal_trait(obj, strip_html)
-    else:
-        for fmt, items in all_matches.items():
-            if items:
-                if printed_header:
-                    print()
-                    
-                print(f"=== {fmt.replace('_', ' ').upper()} MATCHES ===\n")
-                printed_header = True
-
-                table = PrettyTable()
-                if fmt == 'starship_trait':
-                    table.field_names = ["Type", "Name", "Short"]
-                    for obj in items:
-                        table.add_row([obj.get('type', ''), obj.get('name', ''), obj.get('short', '')])
-                elif fmt == 'doff':
-                    table.field_names = ["DOff Specialization", "Ship Duty", "Department", "Description"]
-                    for obj in items:
-                        table.add_row([obj.get('doff_specialization', ''), obj.get('shipdutytype', ''), obj.get('department', ''), strip_html_tags(obj.get('description', '') or '')])
-                elif fmt == 'equipment':
-                    table.field_names = ["Type", "Name", "Rarity"]
-                    for obj in items:
-                        table.add_row([obj.get('type', ''), obj.get('name', ''), obj.get('rarity', '')])
-                elif fmt == 'personal_trait':
-                    table.field_names = ["Name", "Type", "Environment", "Unique"]
-                    for obj in items:
-                        table.add_row([
-                            obj.get('name', ''),
-                            obj.get('type', ''),
-                            obj.get('environment', ''),
-                            'Yes' if obj.get('isunique') else 'No'
-                        ])
-                print(table)
+    for fmt, items in all_matches.items():
+        if printed_header:
+            print()
+
+        print(f"=== {fmt.replace('_', ' ').upper()} MATCHES ===\n")
+        printed_header = True
+
+        if args.full:
+            print_details = _PRINTERS[fmt]
+            for obj in items:
+                print_details(obj, strip_html)
+        else:
+            field_names, build_row = _TABLE_LAYOUTS[fmt]
+            table = PrettyTable(field_names)
+            table.add_rows([build_row(obj) for obj in items])
+            print(table)
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
@@ -0,0 +1,103 @@
+import json
+import os
+import pickle
+import time
+from unittest import mock
+
+import pytest
+
+from sto_cargo_search import cli
+
+DAY = 24 * 60 * 60
+
+class FakeResponse:
+    def __init__(self, data=None, status_code=200):
+        self.ok = status_code < 400
+        self.status_code = status_code
+        self.content = json.dumps(data).encode('utf-8')
+
+class FakeWiki:
+    """Serves one page of rows for every cargo type, or a fixed error status."""
+    def __init__(self, data):
+        self.data = data
+        self.status_code = 200
+
+    def get(self, url, headers=None):
+        if self.status_code != 200:
+            return FakeResponse(status_code=self.status_code)
+        offset = int(url.split('offset=')[1].split('&')[0])
+        return FakeResponse(self.data if offset == 0 else [])
+
+def age(path, days):
+    stamp = time.time() - days * DAY
+    os.utime(path, (stamp, stamp))
+
+def downloader_for(tmp_path, wiki):
+    patches = [
+        mock.patch('requests.Session.get', wiki.get),
+        mock.patch.object(cli, 'PAGE_DELAY_SECONDS', 0),
+    ]
+    for patch in patches:
+        patch.start()
+    return cli.CargoDownloader(cache_dir=tmp_path), patches
+
+def test_failed_revalidation_keeps_existing_cache(tmp_path):
+    wiki = FakeWiki([{'name': 'Beta phaser'}])
+    downloader, patches = downloader_for(tmp_path, wiki)
+    try:
+        downloader.download('doff')
+        path = downloader.cache_file('doff')
+        before = {p.name: p.read_bytes() for p in tmp_path.iterdir()}
+
+        age(path, 4)
+        wiki.status_code = 503
+        downloader.download('doff')
+
+        assert {p.name: p.read_bytes() for p in tmp_path.iterdir()} == before
+        assert json.loads(path.read_bytes()) == [{'name': 'Beta phaser'}]
+    finally:
+        for patch in patches:
+            patch.stop()
+
+def cached_downloader(tmp_path):
+    wiki = FakeWiki([{'name': 'Beta phaser'}, {'name': 'Gamma torpedo'}])
+    downloader, patches = downloader_for(tmp_path, wiki)
+    try:
+        downloader.download('doff')
+    finally:
+        for patch in patches:
+            patch.stop()
+    return downloader
+
+def test_processed_rows_use_fixed_protocol(tmp_path):
+    downloader = cached_downloader(tmp_path)
+    header = downloader.processed_file('doff').read_bytes()[:2]
+    assert header == pickle.PROTO + bytes([cli.PICKLE_PROTOCOL])
+
+@pytest.mark.parametrize('content', [
+    pickle.dumps((cli.PROCESSED_FORMAT_VERSION + 1, []), protocol=4),
+    pickle.dumps(5, protocol=4),
+    pickle.PROTO + bytes([6]) + b'.',
+    b'',
+])
+def test_unusable_processed_rows_are_rebuilt(tmp_path, content):
+    downloader = cached_downloader(tmp_path)
+    expected = downloader.load_processed('doff')
+    path = downloader.processed_file('doff')
+    path.write_bytes(content)
+
+    assert downloader.load_processed('doff') == expected
+    assert path.read_bytes() != content
+
+def test_refresh_keeps_only_current_processed_rows(tmp_path):
+    downloader = cached_downloader(tmp_path)
+    path = downloader.processed_file('doff')
+    age(downloader.cache_file('doff'), 4)
+    age(path, 4)
+    downloader.refresh('doff')
+    assert path.exists()
+    assert downloader.is_derived_valid(path, 'doff')
+
+    age(path, 5)
+    downloader.refresh('doff')
+    assert not path.exists()
@@ -0,0 +1,72 @@
+import pytest
+
+from sto_cargo_search.cli import _build_haystack, parse_search_expression
+
+def matches(expr, text):
+    return parse_search_expression(expr).evaluate(_build_haystack({'text': text}))
+
+def test_and_binds_tighter_than_or():
+    # (a and b) or c
+    assert matches('alpha and beta or gamma', 'gamma')
+    assert not matches('alpha and beta or gamma', 'alpha')
+    # a or (b and c)
+    assert matches('alpha or beta and gamma', 'alpha')
+    assert not matches('alpha or beta and gamma', 'gamma')
+
+def test_not_binds_tighter_than_and():
+    # (not a) and b
+    assert matches('not alpha and beta', 'beta')
+    assert not matches('not alpha and beta', 'alpha beta')
+    assert not matches('not alpha and beta', 'gamma')
+
+def test_parentheses_override_precedence():
+    assert not matches('alpha and (beta or gamma)', 'gamma')
+    assert matches('not (alpha and beta)', 'alpha')
+
+def test_comma_is_or():
+    assert matches('alpha, beta', 'beta')
+    assert matches('alpha,beta', 'alpha')
+    assert not matches('alpha, beta', 'gamma')
+
+def test_keywords_are_case_insensitive():
+    assert matches('alpha AnD beta', 'alpha beta')
+    assert not matches('alpha AND beta', 'alpha')
+    assert matches('alpha Or beta', 'beta')
+    assert matches('NOT alpha', 'beta')
+
+def test_terms_are_case_insensitive():
+    assert matches('PHASER', 'Bar Phaser')
+
+def test_quoted_phrases_are_single_terms():
+    assert matches('"fire at will"', 'Fire at Will')
+    assert not matches('"fire at will"', 'will fire at')
+    assert matches('"and"', 'this and that')
+
+def test_comma_inside_quotes_is_literal():
+    assert matches('"alpha,beta"', 'x alpha,beta y')
+    assert not matches('"alpha,beta"', 'alpha')
+    assert not matches('"alpha,beta"', 'beta')
+
+@pytest.mark.parametrize('word', ['nothing', 'order', 'android', 'notice'])
+def test_keyword_prefixed_words_are_terms(word):
+    assert matches(word, f'the {word} here')
+    assert not matches(word, '')
+
+@pytest.mark.parametrize('expr', [
+    'alpha and',
+    'alpha and and beta',
+    'or alpha',
+    'not',
+    '(alpha',
+    'alpha)',
+    '()',
+    'alpha beta',
+    'alpha $ beta',
+    '"unterminated',
+    '   ',
+])
+def test_invalid_expressions_exit_with_status_1(expr, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        parse_search_expression(expr)
+    assert excinfo.value.code == 1
+    assert 'Error parsing search expression' in capsys.readouterr().out